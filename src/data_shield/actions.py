@@ -1,54 +1,35 @@
 """Module for parameter actions and matching strategies."""
 
+import functools
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from speckle_automate import AutomationContext
 from specklepy.objects import Base
 
-from data_shield.matchers import EmailMatcher, PatternChecker
+from data_shield.matchers import (
+    EmailMatcher,
+    MultiPrefixMatcher,
+    ParameterMatcher,
+    PatternMatcher,
+    PrefixMatcher,
+)
 
-
-class ParameterMatcher(ABC):
-    """Strategy interface for parameter matching logic."""
-
-    def __init__(self, match_value: str, strict_mode: bool = False):
-        """Initialize with a value to match against and a strict mode flag."""
-        self.match_value = match_value
-        self.strict_mode = strict_mode
-
-    @abstractmethod
-    def matches(self, param_name: str) -> bool:
-        """Check if parameter name matches according to this strategy."""
-        pass
-
-
-class PrefixMatcher(ParameterMatcher):
-    """Matches parameters by prefix."""
-
-    def matches(self, param_name: str) -> bool:
-        """Check if the parameter name starts with the match value."""
-        if self.strict_mode:
-            return param_name.startswith(self.match_value)
-        return param_name.lower().startswith(self.match_value.lower())
-
-
-class PatternMatcher(ParameterMatcher):
-    """Matches parameters by regex pattern."""
-
-    def matches(self, param_name: str) -> bool:
-        """Check if the parameter name matches the regex pattern."""
-        pattern = PatternChecker(self.match_value, self.strict_mode)
-        return pattern.check(param_name)
+# Parameter values at least this long are not memoized
+_MEMO_VALUE_MAX_LEN = 128
 
 
 class ParameterAction(ABC):
     """Base class for actions on parameters."""
 
+    # Fast-reject set for name-based checks, taken from the matcher where it offers one
+    first_chars: frozenset[str] | None = None
+
     def __init__(self) -> None:
-        """A dictionary to keep track of parameters affected by the action."""
-        self.affected_parameters: dict[str, list[str]] = defaultdict(list)
+        """Sets to keep track of the parameter names and objects affected by the action."""
+        self.affected_names: set[str] = set()
+        self.affected_object_ids: set[str | None] = set()
 
     @abstractmethod
     def check(self, param_name: str) -> bool:
@@ -56,8 +37,14 @@ class ParameterAction(ABC):
         pass
 
     @abstractmethod
-    def apply(self, parameter: dict[str, Any], parent_object: Base, properties_dict: dict[str, Any], key: str) -> None:
-        """Apply the specific action logic on the parameter."""
+    def apply(
+        self, parameter: dict[str, Any], object_id: str | None, properties_dict: dict[str, Any], key: str
+    ) -> None:
+        """Apply the specific action logic on the parameter.
+
+        The caller resolves the parent object's id once per object and passes it in,
+        rather than each call looking it up again.
+        """
         pass
 
     @abstractmethod
@@ -66,20 +53,79 @@ class ParameterAction(ABC):
         pass
 
 
+def _remove_from_dict(container: dict[str, Any], parameter_key: str, parameter: dict[str, Any]) -> None:
+    """Standard dictionary - just pop the key."""
+    container.pop(parameter_key, None)
+
+
+def _remove_from_base(container: Base, parameter_key: str, parameter: dict[str, Any]) -> None:
+    """For Base objects like Revit parameters, remove the dynamic member from __dict__."""
+    try:
+        container.__dict__.pop(parameter_key, None)
+    except (AttributeError, TypeError):
+        # Only reached for unusual Base subclasses without a writable __dict__
+        _remove_fallback(container, parameter_key, parameter)
+
+
+def _remove_fallback(container: Any, parameter_key: str, parameter: dict[str, Any]) -> None:
+    """Fallback to alternative removal methods if direct dict manipulation fails."""
+    try:
+        delattr(container, parameter_key)
+    except (AttributeError, TypeError):
+        try:
+            setattr(container, parameter_key, None)
+        except (AttributeError, TypeError):
+            # If all removal attempts fail, try one more approach specific to Speckle Base objects
+            if hasattr(container, "get_dynamic_member_names") and parameter_key in container.get_dynamic_member_names():
+                # This is a workaround for dynamic properties in Speckle Base objects
+                application_name = parameter.get("applicationInternalName", parameter_key)
+                if application_name in container.__dict__:
+                    container.__dict__.pop(application_name)
+
+
+def _remove_nothing(container: Any, parameter_key: str, parameter: dict[str, Any]) -> None:
+    """Containers that are neither dicts nor Base objects are left untouched."""
+
+
 class RemovalAction(ParameterAction):
     """Action to remove parameters based on a matching strategy."""
 
+    # Remover per container type, resolved on first sight so apply() needs no type checks
+    _removers: dict[type, Callable[[Any, str, dict[str, Any]], None]] = {}
+
     def __init__(self, matcher: ParameterMatcher) -> None:
         """Initialize with a matcher strategy."""
         super().__init__()
         self.matcher = matcher
+        self.first_chars = matcher.first_chars
+        # Bind the matcher directly so per-parameter checks skip one level of Python dispatch,
+        # unless a subclass has its own check to honour
+        if type(self).check is RemovalAction.check:
+            self.check = matcher.matches  # type: ignore[method-assign]
 
     def check(self, param_name: str) -> bool:
         """Check if parameter matches using the provided matcher."""
         return self.matcher.matches(param_name)
 
+    @classmethod
+    def _resolve_remover(cls, container_type: type) -> Callable[[Any, str, dict[str, Any]], None]:
+        """Pick and cache the removal strategy for a container type."""
+        if issubclass(container_type, dict):
+            remover = _remove_from_dict
+        elif issubclass(container_type, Base):
+            remover = _remove_from_base
+        else:
+            remover = _remove_nothing
+
+        cls._removers[container_type] = remover
+        return remover
+
     def apply(
-        self, parameter: dict[str, Any], parent_object: Base, containing_dict: dict[str, Any] | Base, parameter_key: str
+        self,
+        parameter: dict[str, Any],
+        object_id: str | None,
+        containing_dict: dict[str, Any] | Base,
+        parameter_key: str,
     ) -> None:
         """Remove the parameter from the containing dictionary if it matches.
 
@@ -87,58 +133,31 @@ class RemovalAction(ParameterAction):
 
         Args:
             parameter: The parameter dictionary or object
-            parent_object: The parent Speckle object
+            object_id: The id of the parent Speckle object
             containing_dict: The container (dict or Base object) holding the parameter
             parameter_key: The key or attribute name of the parameter
         """
         param_name = parameter.get("name", parameter_key)
-        object_id = getattr(parent_object, "id", None)
 
         # Handle removal based on the container type
-        if isinstance(containing_dict, dict):
-            # Standard dictionary - just pop the key
-            containing_dict.pop(parameter_key, None)
-        elif isinstance(containing_dict, Base):
-            # For Base objects like Revit parameters, try to remove using __dict__
-            try:
-                if hasattr(containing_dict, "__dict__") and parameter_key in containing_dict.__dict__:
-                    containing_dict.__dict__.pop(parameter_key)
-                else:
-                    # If not in __dict__, try using dynamic attribute removal
-                    containing_dict.__dict__.pop(parameter_key, None)
-            except (AttributeError, KeyError, TypeError):
-                # Fallback to alternative methods if direct dict manipulation fails
-                try:
-                    delattr(containing_dict, parameter_key)
-                except (AttributeError, TypeError):
-                    try:
-                        setattr(containing_dict, parameter_key, None)
-                    except (AttributeError, TypeError):
-                        # If all removal attempts fail, try one more approach specific to Speckle Base objects
-                        if (
-                            hasattr(containing_dict, "get_dynamic_member_names")
-                            and parameter_key in containing_dict.get_dynamic_member_names()
-                        ):
-                            # This is a workaround for dynamic properties in Speckle Base objects
-                            application_name = parameter.get("applicationInternalName", parameter_key)
-                            if application_name in containing_dict.__dict__:
-                                containing_dict.__dict__.pop(application_name)
+        container_type = type(containing_dict)
+        remover = self._removers.get(container_type) or self._resolve_remover(container_type)
+        remover(containing_dict, parameter_key, parameter)
 
         # Track affected object and parameter
-        self.affected_parameters[object_id].append(param_name)
+        self.affected_names.add(param_name)
+        self.affected_object_ids.add(object_id)
 
     def report(self, automate_context: AutomationContext) -> None:
         """Provide feedback based on the action's results."""
-        if not self.affected_parameters:
+        if not self.affected_object_ids:
             return
 
-        removed_params = set(param for params in self.affected_parameters.values() for param in params)
-
-        message = f"The following parameters were removed: {', '.join(removed_params)}"
+        message = f"The following parameters were removed: {', '.join(self.affected_names)}"
 
         automate_context.attach_info_to_objects(
             category="Removed_Parameters",
-            object_ids=list(self.affected_parameters.keys()),
+            object_ids=list(self.affected_object_ids),
             message=message,
         )
 
@@ -151,18 +170,36 @@ class AnonymizationAction(ParameterAction):
         super().__init__()
         self.email_matcher = EmailMatcher()
         self.anonymized_count = 0
+        # Short values such as contact emails repeat across many objects, so remember their verdicts
+        self._contains_email_cached = functools.lru_cache(maxsize=4096)(self.email_matcher.contains_email)
+        self._anonymize_email_cached = functools.lru_cache(maxsize=4096)(self.email_matcher.anonymize_email)
 
     def check(self, param_value: str) -> bool:
         """Check if parameter value contains an email address."""
-        return isinstance(param_value, str) and self.email_matcher.contains_email(param_value)
+        # Values without an "@" cannot hold an email, so skip the matcher for them
+        if not isinstance(param_value, str) or "@" not in param_value:
+            return False
+        # Long values rarely repeat and would only bloat the cache
+        if len(param_value) < _MEMO_VALUE_MAX_LEN:
+            return self._contains_email_cached(param_value)
+        return self.email_matcher.contains_email(param_value)
+
+    def _anonymize(self, param_value: str) -> str:
+        """Anonymize a value, reusing the result for short values seen before."""
+        if len(param_value) < _MEMO_VALUE_MAX_LEN:
+            return self._anonymize_email_cached(param_value)
+        return self.email_matcher.anonymize_email(param_value)
 
     def apply(
-        self, parameter: dict[str, Any], parent_object: Base, containing_dict: dict[str, Any] | Base, parameter_key: str
+        self,
+        parameter: dict[str, Any],
+        object_id: str | None,
+        containing_dict: dict[str, Any] | Base,
+        parameter_key: str,
     ) -> None:
         """Anonymize email addresses in the parameter value."""
-        # Get parameter name and object ID - same as RemovalAction
+        # Get parameter name - same as RemovalAction
         param_name = parameter.get("name", parameter_key)
-        object_id = getattr(parent_object, "id", None)
 
         # Get the value to anonymize
         param_value = None
@@ -170,13 +207,14 @@ class AnonymizationAction(ParameterAction):
         # For dictionary-style parameters
         if isinstance(parameter, dict) and "value" in parameter:
             param_value = parameter["value"]
-            if isinstance(param_value, str) and self.email_matcher.contains_email(param_value):
+            if self.check(param_value):
                 # Anonymize and update
-                anonymized_value = self.email_matcher.anonymize_email(param_value)
+                anonymized_value = self._anonymize(param_value)
                 parameter["value"] = anonymized_value
 
                 # Track affected parameters - EXACTLY like RemovalAction does
-                self.affected_parameters[object_id].append(param_name)
+                self.affected_names.add(param_name)
+                self.affected_object_ids.add(object_id)
                 self.anonymized_count += 1
 
         # For Base object parameters (like in Revit)
@@ -191,37 +229,59 @@ class AnonymizationAction(ParameterAction):
 
                 if param_obj and hasattr(param_obj, "value"):
                     param_value = getattr(param_obj, "value")
-                    if isinstance(param_value, str) and self.email_matcher.contains_email(param_value):
+                    if self.check(param_value):
                         # Anonymize and update
-                        anonymized_value = self.email_matcher.anonymize_email(param_value)
+                        anonymized_value = self._anonymize(param_value)
                         setattr(param_obj, "value", anonymized_value)
 
                         # Track affected parameters - EXACTLY like RemovalAction does
-                        self.affected_parameters[object_id].append(param_name)
+                        self.affected_names.add(param_name)
+                        self.affected_object_ids.add(object_id)
                         self.anonymized_count += 1
             except KeyError:
                 pass  # Skip if any error occurs
 
     def report(self, automate_context: AutomationContext) -> None:
         """Provide feedback based on the action's results."""
-        if not self.affected_parameters:
+        if not self.affected_object_ids:
             return
 
         # Copy the exact pattern from RemovalAction for consistency
-        anonymized_params = set(param for params in self.affected_parameters.values() for param in params)
-        message = f"Email addresses were anonymized in {len(anonymized_params)} parameters"
+        message = f"Email addresses were anonymized in {len(self.affected_names)} parameters"
 
         automate_context.attach_info_to_objects(
             category="Anonymized_Parameters",
-            object_ids=list(self.affected_parameters.keys()),
+            object_ids=list(self.affected_object_ids),
             message=message,
         )
 
 
 # Factory functions to create specific actions with the right matcher
 def create_prefix_removal_action(forbidden_prefix: str, strict_mode: bool = False) -> RemovalAction:
-    """Create a removal action that matches by prefix."""
-    matcher = PrefixMatcher(forbidden_prefix, strict_mode)
+    """Create a removal action that matches by prefix.
+
+    Several prefixes can be given separated by commas (e.g. ``"secret_, internal_"``);
+    they are matched together by a single MultiPrefixMatcher.
+
+    Raises:
+        ValueError: If the input holds only commas and whitespace.
+    """
+    # Input without a comma is a single prefix, used verbatim
+    if "," not in forbidden_prefix:
+        return RemovalAction(PrefixMatcher(forbidden_prefix, strict_mode))
+
+    prefixes = [prefix.strip() for prefix in forbidden_prefix.split(",") if prefix.strip()]
+    if not prefixes:
+        raise ValueError(f"No parameter prefix found in {forbidden_prefix!r}; commas only separate prefixes.")
+    if len(prefixes) == 1:
+        return RemovalAction(PrefixMatcher(prefixes[0], strict_mode))
+
+    return create_multi_prefix_removal_action(prefixes, strict_mode)
+
+
+def create_multi_prefix_removal_action(forbidden_prefixes: list[str], strict_mode: bool = False) -> RemovalAction:
+    """Create a removal action that matches by any of several prefixes."""
+    matcher = MultiPrefixMatcher(forbidden_prefixes, strict_mode)
     return RemovalAction(matcher)
 
 
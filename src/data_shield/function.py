@@ -1,8 +1,11 @@
 """Updated main Automate function for parameter sanitization."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from speckle_automate import AutomationContext
 
 from data_shield.actions import (
+    ParameterAction,
     create_anonymization_action,
     create_pattern_removal_action,
     create_prefix_removal_action,
@@ -23,14 +26,18 @@ def automate_function(
         function_inputs: The function inputs
     """
     # Create appropriate action based on sanitization mode
-    action = None
+    action: ParameterAction | None = None
     check_values = False
 
     if function_inputs.sanitization_mode == SanitizationMode.PREFIX_MATCHING:
         if not function_inputs.parameter_input:
             automate_context.mark_run_failed("No parameter prefix has been set for PREFIX_MATCHING mode.")
             return
-        action = create_prefix_removal_action(function_inputs.parameter_input, function_inputs.strict_mode)
+        try:
+            action = create_prefix_removal_action(function_inputs.parameter_input, function_inputs.strict_mode)
+        except ValueError as error:
+            automate_context.mark_run_failed(str(error))
+            return
 
     elif function_inputs.sanitization_mode == SanitizationMode.PATTERN_MATCHING:
         if not function_inputs.parameter_input:
@@ -63,11 +70,16 @@ def automate_function(
     trigger_model_id = run_data.triggers[0].payload.model_id
     project_id = run_data.project_id
 
-    # the automate_context includes an authenticated Speckle client which we can use specklepy methods with
-    trigger_model = automate_context.speckle_client.model.get(trigger_model_id, project_id)
+    # the automate_context includes an authenticated Speckle client which we can use specklepy methods with.
+    # The lookup is network-bound, so fetch it in the background while the parameter pass runs on this thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        trigger_model_future = executor.submit(automate_context.speckle_client.model.get, trigger_model_id, project_id)
+
+        process_context = processor.process_context
+        for context in traversal_contexts:
+            process_context(context)
 
-    for context in traversal_contexts:
-        processor.process_context(context)
+        trigger_model = trigger_model_future.result()
 
     if not processor.processed_objects:
         automate_context.mark_run_success("No parameters were processed.")
@@ -1,13 +1,31 @@
 """Helper classes and functions for the parameter checker."""
 
+from typing import Any
+
 from specklepy.objects import Base
+from specklepy.objects.graph_traversal.traversal import TraversalContext
 
 from data_shield.actions import ParameterAction
 
+# Sentinel for dict lookups where None is a legitimate parameter value
+_MISSING = object()
+
+# Base members that are never Revit parameters
+_NON_PARAM_KEYS = frozenset(("speckle_type", "id", "totalChildrenCount", "applicationId", "units"))
+
 
 class ParameterProcessor:
     """Class to handle parameter processing with various actions."""
 
+    __slots__ = (
+        "action",
+        "check_values",
+        "processed_objects",
+        "total_objects_processed",
+        "revit_params_processed",
+        "_walk_properties",
+    )
+
     def __init__(self, action: ParameterAction, check_values: bool = False):
         """Initialize the parameter processor with an action.
 
@@ -15,14 +33,16 @@ class ParameterProcessor:
             action: The parameter action to apply
             check_values: If True, check parameter values instead of names
         """
-        self.action = action
-        self.check_values = check_values
-        self.processed_objects = set()
+        self.action: ParameterAction = action
+        self.check_values: bool = check_values
+        # The mode is fixed for the run, so pick the matching walker once instead of branching per parameter
+        self._walk_properties = self._walk_properties_by_value if check_values else self._walk_properties_by_name
+        self.processed_objects: set[str | None] = set()
         # Debug counters
-        self.total_objects_processed = 0
-        self.revit_params_processed = 0
+        self.total_objects_processed: int = 0
+        self.revit_params_processed: int = 0
 
-    def process_context(self, context):
+    def process_context(self, context: TraversalContext) -> None:
         """Process a traversal context to handle parameters and properties.
 
         Args:
@@ -31,110 +51,168 @@ class ParameterProcessor:
         current_object = context.current
         self.total_objects_processed += 1
 
+        # Both members are dynamic per instance, not per class, so each is read once with a default
+        properties = getattr(current_object, "properties", None)
+        parameters = getattr(current_object, "parameters", None)
+
+        # Most traversed objects (geometry, collections) carry neither
+        if properties is None and parameters is None:
+            return
+
+        object_id = getattr(current_object, "id", None)
+
         # First handle modern v3 properties
-        if hasattr(current_object, "properties") and current_object.properties is not None:
-            properties_dict = (
-                current_object.properties.__dict__
-                if isinstance(current_object.properties, Base)
-                else current_object.properties
-            )
-            self.process_properties_dict(properties_dict, current_object)
+        if properties is not None:
+            properties_dict = properties.__dict__ if isinstance(properties, Base) else properties
+            self.process_properties_dict(properties_dict, object_id)
 
         # Then handle legacy v2 Revit parameters
-        if hasattr(current_object, "parameters") and current_object.parameters is not None:
-            self.process_revit_parameters(current_object)
+        if parameters is not None:
+            self.process_revit_parameters(parameters, object_id)
+
+    def process_properties_dict(self, properties_dict: dict[str, Any], object_id: str | None) -> None:
+        """Process v3-style properties dictionary to find and apply the action to parameters.
 
-    def process_properties_dict(self, properties_dict, current_object):
-        """Recursively process v3-style properties dictionary to find and apply the action to parameters.
+        Nested dictionaries are walked with an explicit stack rather than recursion,
+        which avoids per-level call overhead on deeply nested property trees.
 
         Args:
             properties_dict: The properties dictionary to process
-            current_object: The current object being processed
+            object_id: The id of the object the properties belong to
         """
         if not properties_dict:
             return
 
-        for key, value in list(properties_dict.items()):  # Safe iteration during mutation
-            if isinstance(value, dict) and "value" in value:
+        self._walk_properties(properties_dict, object_id)
+
+    def _walk_properties_by_name(self, properties_dict: dict[str, Any], object_id: str | None) -> None:
+        """Walk a properties tree checking parameter names (for actions like removal)."""
+        # Bind hot lookups to locals once for the whole walk
+        first_chars = self.action.first_chars
+        action_check = self.action.check
+        action_apply = self.action.apply
+        mark_processed = self.processed_objects.add
+
+        stack = [properties_dict]
+        while stack:
+            current_dict = stack.pop()
+            # Matches are applied after the scan, so the dict can be iterated without a snapshot
+            matched = []
+
+            for key, value in current_dict.items():
+                # Most leaves are scalars - skip them before doing any other work.
+                # Deserialized properties are plain dicts, so an exact type test is enough
+                if type(value) is not dict:
+                    continue
+
+                if "value" not in value:
+                    # Descend into nested dictionaries
+                    stack.append(value)
+                    continue
+
                 param_name = value.get("name", key)
+                if first_chars is not None:
+                    lead = param_name[:1]
+                    # An ASCII lead outside the set rules the name out without calling the matcher
+                    if lead not in first_chars and lead.isascii():
+                        continue
+
+                if action_check(param_name):
+                    matched.append((key, value))
+
+            # Actions such as removal mutate the dict, which is safe now that iteration is done
+            if matched:
+                for key, value in matched:
+                    action_apply(value, object_id, current_dict, key)
+                # Every match in a walk belongs to the same object, so record it once per dict
+                mark_processed(object_id)
+
+    def _walk_properties_by_value(self, properties_dict: dict[str, Any], object_id: str | None) -> None:
+        """Walk a properties tree checking parameter values (for actions like anonymization)."""
+        # Bind hot lookups to locals once for the whole walk
+        action_check = self.action.check
+        action_apply = self.action.apply
+        mark_processed = self.processed_objects.add
+
+        stack = [properties_dict]
+        while stack:
+            current_dict = stack.pop()
+            # Matches are applied after the scan, so the dict can be iterated without a snapshot
+            matched = []
+
+            for key, value in current_dict.items():
+                # Most leaves are scalars - skip them before doing any other work.
+                # Deserialized properties are plain dicts, so an exact type test is enough
+                if type(value) is not dict:
+                    continue
+
+                # A single probe both detects a parameter and fetches the value to check
+                param_value = value.get("value", _MISSING)
+                if param_value is _MISSING:
+                    # Descend into nested dictionaries
+                    stack.append(value)
+                    continue
+
+                if action_check(param_value):
+                    matched.append((key, value))
 
-                # Check based on mode (name or value)
-                if self.check_values:
-                    # For value-based actions (like anonymization)
-                    param_value = value.get("value", "")
-                    if self.action.check(param_value):
-                        self.action.apply(value, current_object, properties_dict, key)
-                        self.processed_objects.add(current_object.id)
-                else:
-                    # For name-based actions (like removal)
-                    if self.action.check(param_name):
-                        self.action.apply(value, current_object, properties_dict, key)
-                        self.processed_objects.add(current_object.id)
-
-            elif isinstance(value, dict):
-                # Recurse into nested dictionaries
-                self.process_properties_dict(value, current_object)
-
-    def process_revit_parameters(self, current_object):
+            if matched:
+                for key, value in matched:
+                    action_apply(value, object_id, current_dict, key)
+                mark_processed(object_id)
+
+    def process_revit_parameters(self, parameters: Base | dict[str, Any] | None, object_id: str | None) -> None:
         """Process v2 Revit-style parameters to find and apply the action.
 
         Revit parameters are stored as Base objects with speckle_type 'Objects.BuiltElements.Revit.Parameter'
         and can be accessed via current_object.parameters.
 
         Args:
-            current_object: The current object being processed
+            parameters: The parameters member of the object being processed
+            object_id: The id of the object the parameters belong to
         """
-        if not hasattr(current_object, "parameters") or current_object.parameters is None:
+        if parameters is None:
             return
 
-        parameters = current_object.parameters
-
         # If parameters is a dictionary rather than a Base object, use it directly
         if isinstance(parameters, dict):
-            self.process_properties_dict(parameters, current_object)
+            self.process_properties_dict(parameters, object_id)
             return
 
-        # Get all parameter keys - handle different ways of storing parameters
-        param_keys = []
-
-        # Try get_dynamic_member_names() for Base objects
-        if hasattr(parameters, "get_dynamic_member_names"):
-            param_keys.extend(parameters.get_dynamic_member_names())
+        # Dynamic members of a Base live in its __dict__, so keys and values come out in one pass
+        members = getattr(parameters, "__dict__", None)
+        if members is not None:
+            param_items = members.items()
+        else:
+            # Try dir() as a last resort
+            param_items = (
+                (k, getattr(parameters, k, None))
+                for k in dir(parameters)
+                if not k.startswith("_") and k != "get_dynamic_member_names"
+            )
 
-        # Try __dict__ for standard attributes
-        if hasattr(parameters, "__dict__"):
-            param_keys.extend(k for k in parameters.__dict__.keys() if not k.startswith("_"))
+        # Bind hot lookups to locals for the parameter loop
+        first_chars = None if self.check_values else self.action.first_chars
+        action_check = self.action.check
+        action_apply = self.action.apply
+        check_values = self.check_values
+        mark_processed = self.processed_objects.add
 
-        # Try dir() as a last resort
-        if not param_keys:
-            param_keys.extend(k for k in dir(parameters) if not k.startswith("_") and k != "get_dynamic_member_names")
+        # Actions may remove members, so matches are applied once iteration is done
+        matched = []
 
         # Process each parameter
-        for parameter_key in param_keys:
-            # Track for debugging
-            self.revit_params_processed += 1
-
-            # Skip known non-parameter attributes
-            if parameter_key in ["speckle_type", "id", "totalChildrenCount"]:
+        for parameter_key, param_obj in param_items:
+            # Skip private attributes, known non-parameter attributes and values that cannot be parameters
+            if (
+                parameter_key.startswith("_")
+                or parameter_key in _NON_PARAM_KEYS
+                or not isinstance(param_obj, (Base, dict))
+            ):
                 continue
 
-            # Get the parameter object using multiple methods
-            param_obj = None
-            param_value = None
-
-            # Try __getitem__ first (common for Revit parameters)
-            try:
-                param_obj = parameters.__getitem__(f"{parameter_key}")
-            except (AttributeError, KeyError, TypeError):
-                try:
-                    # Try direct attribute access
-                    param_obj = getattr(parameters, parameter_key, None)
-                except KeyError:
-                    continue
-
-            # If we couldn't get the parameter, skip it
-            if param_obj is None:
-                continue
+            # Track for debugging
+            self.revit_params_processed += 1
 
             # Prepare a parameter dict with the info we have
             param_dict = {}
@@ -143,30 +221,37 @@ class ParameterProcessor:
             param_name = getattr(param_obj, "name", parameter_key) if isinstance(param_obj, Base) else parameter_key
             param_dict["name"] = param_name
 
+            if first_chars is not None and isinstance(param_name, str):
+                lead = param_name[:1]
+                # An ASCII lead outside the set rules the name out without calling the matcher
+                if lead not in first_chars and lead.isascii():
+                    continue
+
             # Get the value
-            if isinstance(param_obj, Base) and hasattr(param_obj, "value"):
-                param_value = getattr(param_obj, "value")
-                param_dict["value"] = param_value
-            elif isinstance(param_obj, dict) and "value" in param_obj:
-                param_value = param_obj["value"]
-                param_dict["value"] = param_value
+            if isinstance(param_obj, Base):
+                param_value = getattr(param_obj, "value", _MISSING)
             else:
+                param_value = param_obj.get("value", _MISSING)
+            if param_value is _MISSING:
                 # If we can't find a value, this might not be a parameter
                 continue
+            param_dict["value"] = param_value
 
             # Add any other useful metadata
             param_dict["applicationInternalName"] = parameter_key
 
             # Check based on mode (name or value)
-            if self.check_values:
+            if check_values:
                 # For value-based actions (like anonymization)
-                if isinstance(param_value, str) and self.action.check(param_value):
-                    # Apply the action
-                    self.action.apply(param_dict, current_object, parameters, parameter_key)
-                    self.processed_objects.add(current_object.id)
+                if isinstance(param_value, str) and action_check(param_value):
+                    matched.append((param_dict, parameter_key))
             else:
                 # For name-based actions (like removal)
-                if self.action.check(param_name):
-                    # Apply the action
-                    self.action.apply(param_dict, current_object, parameters, parameter_key)
-                    self.processed_objects.add(current_object.id)
+                if action_check(param_name):
+                    matched.append((param_dict, parameter_key))
+
+        # Apply the action
+        if matched:
+            for param_dict, parameter_key in matched:
+                action_apply(param_dict, object_id, parameters, parameter_key)
+            mark_processed(object_id)
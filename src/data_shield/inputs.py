@@ -46,8 +46,11 @@ class FunctionInputs(AutomateBase):
     parameter_input: str = Field(
         title="Parameter Prefix to Cleanse",
         default="",
-        description="Enter a pattern. Use '*' and '?' for simple matching. For regex, wrap in slashes like `/^foo_/`.",
-        examples=["foo_*", "/^foo_\\d+$/i"]
+        description=(
+            "Enter a pattern. Use '*' and '?' for simple matching. For regex, wrap in slashes like `/^foo_/`. "
+            "In Prefix Matching mode, separate several prefixes with commas like `foo_, bar_`."
+        ),
+        examples=["foo_*", "/^foo_\\d+$/i", "foo_, bar_"]
     )
 
     strict_mode: bool = Field(
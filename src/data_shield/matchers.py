@@ -1,10 +1,17 @@
 """Module for parameter matching strategies and pattern checking."""
 
 import fnmatch
+import functools
 import re
 from abc import ABC, abstractmethod
 from re import Pattern
 
+# Marks the end of a complete prefix inside a MultiPrefixMatcher trie node
+_TRIE_END = None
+
+# Up to this many prefixes, str.startswith with a tuple beats walking a trie in Python
+_PREFIX_TUPLE_LIMIT = 32
+
 
 class ParameterMatcher(ABC):
     """Strategy interface for parameter matching logic."""
@@ -13,6 +20,13 @@ class ParameterMatcher(ABC):
         """Initialize with a value to match against and a strict mode flag."""
         self.match_value = match_value
         self.strict_mode = strict_mode
+        # Models repeat the same few parameter names across thousands of objects,
+        # so remember each verdict instead of re-running the matcher for it
+        self.matches = functools.lru_cache(maxsize=4096)(self.matches)  # type: ignore[method-assign]
+
+    # Parameter names whose first character is ASCII and not in this set can never match.
+    # None means the matcher offers no such shortcut.
+    first_chars: frozenset[str] | None = None
 
     @abstractmethod
     def matches(self, param_name: str) -> bool:
@@ -20,28 +34,124 @@ class ParameterMatcher(ABC):
         pass
 
 
+def _leading_chars(prefixes: list[str], strict_mode: bool) -> frozenset[str] | None:
+    """Collect the first characters a name needs to possibly start with one of the prefixes.
+
+    Returns None when an empty prefix makes every name a match.
+    """
+    if any(not prefix for prefix in prefixes):
+        return None
+    if strict_mode:
+        return frozenset(prefix[0] for prefix in prefixes)
+    # Case-insensitive: accept either case of each (lowercased) leading character
+    leads = {prefix[0].lower() for prefix in prefixes}
+    return frozenset(leads | {lead.upper() for lead in leads})
+
+
 class PrefixMatcher(ParameterMatcher):
     """Matches parameters by prefix."""
 
+    def __init__(self, match_value: str, strict_mode: bool = False):
+        """Initialize and precompute the lowercase prefix for case-insensitive checks."""
+        super().__init__(match_value, strict_mode)
+        self._match_lower = match_value.lower()
+        self._match_len = len(self._match_lower)
+        self.first_chars = _leading_chars([match_value], strict_mode)
+
     def matches(self, param_name: str) -> bool:
         """Check if the parameter name starts with the match value."""
         if self.strict_mode:
             return param_name.startswith(self.match_value)
-        return param_name.lower().startswith(self.match_value.lower())
+        # ASCII lowercases one character at a time, so only the leading slice needs it. Other scripts
+        # can lengthen a character ("İ") or depend on what follows (final "Σ"), so lower the whole name
+        head = param_name[: self._match_len]
+        if head.isascii():
+            return head.lower().startswith(self._match_lower)
+        return param_name.lower().startswith(self._match_lower)
+
+
+class MultiPrefixMatcher(ParameterMatcher):
+    """Matches parameters against several prefixes at once.
+
+    Small prefix sets are tested with a single C-level ``str.startswith`` call on a
+    tuple. Larger sets are compiled into a character trie, so each parameter name is
+    classified in a single walk of at most the longest prefix's length, however many
+    prefixes are configured.
+    """
+
+    def __init__(self, prefixes: list[str], strict_mode: bool = False):
+        """Initialize and build the prefix tuple or trie."""
+        super().__init__(",".join(prefixes), strict_mode)
+        self.prefixes = list(prefixes)
+        normalized = self.prefixes if strict_mode else [prefix.lower() for prefix in self.prefixes]
+        self._max_len = max((len(prefix) for prefix in normalized), default=0)
+        self._prefix_tuple: tuple[str, ...] | None = None
+        self._trie: dict = {}
+
+        if len(normalized) <= _PREFIX_TUPLE_LIMIT:
+            self._prefix_tuple = tuple(normalized)
+        else:
+            for prefix in normalized:
+                node = self._trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node[_TRIE_END] = True
+
+        self.first_chars = _leading_chars(self.prefixes, strict_mode)
+
+    def matches(self, param_name: str) -> bool:
+        """Check if the parameter name starts with any of the prefixes."""
+        # Characters past the longest prefix can never affect the outcome
+        candidate = param_name[: self._max_len]
+        if not self.strict_mode:
+            # Non-ASCII lowercasing can depend on the characters after the slice, as in PrefixMatcher
+            candidate = candidate.lower() if candidate.isascii() else param_name.lower()
+
+        if self._prefix_tuple is not None:
+            return candidate.startswith(self._prefix_tuple)
+
+        node = self._trie
+        if _TRIE_END in node:
+            return True
+        for char in candidate:
+            child = node.get(char)
+            if child is None:
+                return False
+            if _TRIE_END in child:
+                return True
+            node = child
+        return False
 
 
 class PatternMatcher(ParameterMatcher):
     """Matches parameters by regex pattern."""
 
+    def __init__(self, match_value: str, strict_mode: bool = False):
+        """Initialize and compile the pattern once for reuse across all checks."""
+        super().__init__(match_value, strict_mode)
+        self._checker = PatternChecker(match_value, strict_mode)
+
     def matches(self, param_name: str) -> bool:
         """Check if the parameter name matches the regex pattern."""
-        pattern_checker = PatternChecker(self.match_value, self.strict_mode)
-        return pattern_checker.check(param_name)
+        return self._checker.check(param_name)
 
 
 class PatternChecker:
     """Checks if a parameter name matches a user-defined pattern."""
 
+    __slots__ = ("is_regex", "user_strict", "ignore_case", "regex", "pattern", "_literal_prefix")
+
+    def __new__(cls, pattern: str, strict: bool = True):
+        """Picks the specialized checker for the pattern kind, so check() does not branch per call."""
+        if cls is PatternChecker:
+            if _is_regex_pattern(pattern):
+                cls = _RegexChecker
+            elif strict:
+                cls = _GlobChecker
+            else:
+                cls = _GlobIgnoreCaseChecker
+        return super().__new__(cls)
+
     def __init__(self, pattern: str, strict: bool = True):
         """Initializes the pattern checker.
 
@@ -49,7 +159,7 @@ class PatternChecker:
             pattern: User-defined pattern. Glob by default; /regex/ for regex; /regex/i for ignore-case.
             strict: Switches case-insensitive matching for both glob and regex (unless overridden by /i in regex).
         """
-        self.is_regex = pattern.startswith("/") and (pattern.rstrip("i").endswith("/"))
+        self.is_regex = _is_regex_pattern(pattern)
         self.user_strict = strict
 
         if self.is_regex:
@@ -64,31 +174,140 @@ class PatternChecker:
             flags = re.IGNORECASE if self.ignore_case else 0
             self.regex = re.compile(pattern_body, flags)
             self.pattern = pattern_body
+            self._literal_prefix = "" if self.ignore_case else _regex_literal_prefix(pattern_body)
         else:
-            self.regex = None
             self.pattern = pattern
             self.ignore_case = not strict
+            # Translate the glob once instead of going through fnmatch's cache on every check
+            self.regex = re.compile(fnmatch.translate(pattern.lower() if self.ignore_case else pattern))
+            self._literal_prefix = _glob_literal_prefix(pattern.lower() if self.ignore_case else pattern)
 
     def check(self, param_name: str) -> bool:
         """Checks if the parameter name matches the user-defined pattern."""
         if self.is_regex:
             return self.regex.search(param_name) is not None
-        # For glob: emulate strict or non-strict
+        # For glob: emulate strict or non-strict; translated globs are anchored at the end
         if self.ignore_case:
-            return fnmatch.fnmatch(param_name.lower(), self.pattern.lower())
-        else:
-            return fnmatch.fnmatchcase(param_name, self.pattern)
+            param_name = param_name.lower()
+        return self.regex.match(param_name) is not None
+
+
+def _is_regex_pattern(pattern: str) -> bool:
+    """Returns whether a user pattern is written as /regex/ or /regex/i."""
+    return pattern.startswith("/") and (pattern.rstrip("i").endswith("/"))
+
+
+def _glob_literal_prefix(pattern: str) -> str:
+    """Returns the literal text a glob starts with, up to its first wildcard."""
+    for index, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:index]
+    return pattern
+
+
+# Characters trusted to be literal when they follow a regex's ^ anchor
+_LITERAL_RUN: Pattern = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _regex_literal_prefix(pattern: str) -> str:
+    """Returns literal text every match of a ^-anchored regex must start with, or "" if unsure."""
+    # Only a plain run of word characters after ^ is trusted; alternation could match without it
+    if not pattern.startswith("^") or "|" in pattern:
+        return ""
+    run = _LITERAL_RUN.match(pattern, 1)
+    if run is None:
+        return ""
+    literal = run.group()
+    # A following ?, * or {m,n} quantifier may drop the last character of the run
+    if pattern[1 + len(literal) : 2 + len(literal)] in ("?", "*", "{"):
+        literal = literal[:-1]
+    return literal
+
+
+class _RegexChecker(PatternChecker):
+    """PatternChecker for /regex/ patterns."""
+
+    __slots__ = ()
+
+    def check(self, param_name: str) -> bool:
+        """Checks if the regex is found anywhere in the parameter name."""
+        # Anchored regexes with a literal start are rejected by a plain prefix test first
+        if not param_name.startswith(self._literal_prefix):
+            return False
+        return self.regex.search(param_name) is not None
+
+
+class _GlobChecker(PatternChecker):
+    """PatternChecker for case-sensitive globs."""
+
+    __slots__ = ()
+
+    def check(self, param_name: str) -> bool:
+        """Checks if the whole parameter name matches the glob."""
+        if not param_name.startswith(self._literal_prefix):
+            return False
+        return self.regex.match(param_name) is not None
+
+
+class _GlobIgnoreCaseChecker(PatternChecker):
+    """PatternChecker for case-insensitive globs, translated from the lowercased pattern."""
+
+    __slots__ = ()
+
+    def check(self, param_name: str) -> bool:
+        """Checks if the lowercased parameter name matches the glob."""
+        param_name = param_name.lower()
+        if not param_name.startswith(self._literal_prefix):
+            return False
+        return self.regex.match(param_name) is not None
+
+
+# Email regex pattern - basic pattern to identify email addresses
+_EMAIL_ADDRESS = r"(?P<local>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+
+# The lookbehind only lets a search start where a run of local-part characters begins, so a failed
+# search no longer retries at every position inside a long run (quadratic in the run length).
+# The first address found is the same as without it, since an address inside a run also matches
+# from the start of the run.
+EMAIL_PATTERN = r"(?<![a-zA-Z0-9._%+-])" + _EMAIL_ADDRESS
+
+# Compiled once at import and shared by every EmailMatcher instance
+_EMAIL_RE: Pattern = re.compile(EMAIL_PATTERN)
+# Unanchored form, tried only where the previous address ended
+_EMAIL_ADDRESS_RE: Pattern = re.compile(_EMAIL_ADDRESS)
+
+
+def _mask_email(match_obj: re.Match) -> str:
+    """Replace function for regex sub to anonymize matched emails."""
+    # The named groups hand back both halves without re-splitting the match
+    local = match_obj.group("local")
+    domain = match_obj.group("domain")
+
+    # Anonymize the local part: keep first and last character, replace rest with asterisks
+    if len(local) > 2:
+        # For longer local parts, keep first and last characters
+        anonymized_local = local[0] + "*" * (len(local) - 2) + local[-1]
+    elif len(local) == 2:
+        # For 2-character local parts, show first character and one asterisk
+        anonymized_local = local[0] + "*"
+    else:
+        # For 1-character local parts, just use an asterisk
+        anonymized_local = "*"
+
+    # Return the anonymized email
+    return f"{anonymized_local}@{domain}"
 
 
 class EmailMatcher:
     """Class for identifying and anonymizing email addresses in parameter values."""
 
-    # Email regex pattern - basic pattern to identify email addresses
-    EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+    EMAIL_PATTERN = EMAIL_PATTERN
+
+    __slots__ = ("pattern",)
 
     def __init__(self):
-        """Initialize with a compiled regex pattern for email matching."""
-        self.pattern: Pattern = re.compile(self.EMAIL_PATTERN)
+        """Initialize with the shared precompiled regex pattern for email matching."""
+        self.pattern: Pattern = _EMAIL_RE
 
     def contains_email(self, value: str) -> bool:
         """Check if a string contains an email address.
@@ -102,7 +321,11 @@ class EmailMatcher:
         if not isinstance(value, str):
             return False
 
-        return bool(self.pattern.search(value))
+        # An address needs an "@" - a C-level scan for it rejects most values without the regex engine
+        if "@" not in value:
+            return False
+
+        return _EMAIL_RE.search(value) is not None
 
     def anonymize_email(self, value: str) -> str:
         """Anonymize email addresses in a string.
@@ -118,29 +341,22 @@ class EmailMatcher:
         Returns:
             str: The string with anonymized email addresses
         """
-        if not isinstance(value, str):
+        if not isinstance(value, str) or "@" not in value:
             return value
 
-        def replace_email(match_obj):
-            """Replace function for regex sub to anonymize matched emails."""
-            email = match_obj.group(0)
-
-            # Split the email into local part and domain part
-            local, domain = email.split("@", 1)
-
-            # Anonymize the local part: keep first and last character, replace rest with asterisks
-            if len(local) > 2:
-                # For longer local parts, keep first and last characters
-                anonymized_local = local[0] + "*" * (len(local) - 2) + local[-1]
-            elif len(local) == 2:
-                # For 2-character local parts, show first character and one asterisk
-                anonymized_local = local[0] + "*"
-            else:
-                # For 1-character local parts, just use an asterisk
-                anonymized_local = "*"
-
-            # Return the anonymized email
-            return f"{anonymized_local}@{domain}"
+        found = _EMAIL_RE.search(value)
+        if found is None:
+            return value
 
-        # Replace all email addresses in the string
-        return self.pattern.sub(replace_email, value)
+        # Replace all email addresses in the string. Like re.sub with the unanchored pattern, the
+        # next address may start right where the previous one ended, even inside a local-part run
+        # (e.g. "a@b.com+c@d.org"), so that position is tried before the anchored search resumes.
+        parts = []
+        end = 0
+        while found is not None:
+            parts.append(value[end : found.start()])
+            parts.append(_mask_email(found))
+            end = found.end()
+            found = _EMAIL_ADDRESS_RE.match(value, end) or _EMAIL_RE.search(value, end)
+        parts.append(value[end:])
+        return "".join(parts)
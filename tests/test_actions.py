@@ -0,0 +1,55 @@
+"""Unit tests for the parameter actions and their factories."""
+
+import pytest
+
+from data_shield.actions import create_prefix_removal_action
+from data_shield.matchers import MultiPrefixMatcher, PrefixMatcher
+
+
+class TestCreatePrefixRemovalAction:
+    """Test how the Prefix Matching input is parsed into matchers."""
+
+    def test_single_prefix_is_used_verbatim(self) -> None:
+        """Input without a comma keeps the one prefix as typed."""
+        action = create_prefix_removal_action("secret_")
+
+        assert isinstance(action.matcher, PrefixMatcher)
+        assert action.check("secret_x")
+        assert action.check("SECRET_x")
+        assert not action.check("public_x")
+
+    @pytest.mark.parametrize("raw_input", ["secret_,", "secret_, ", " secret_ ,", ",secret_"])
+    def test_stray_commas_leave_a_single_prefix(self, raw_input: str) -> None:
+        """Separators and surrounding spaces are not part of the prefix."""
+        action = create_prefix_removal_action(raw_input)
+
+        assert isinstance(action.matcher, PrefixMatcher)
+        assert action.check("secret_x")
+        assert not action.check("secret,x")
+
+    @pytest.mark.parametrize("raw_input", [",", " , ", ",,", " ,\t, "])
+    def test_separators_only_are_rejected(self, raw_input: str) -> None:
+        """Input made only of separators names no prefix and is not taken literally."""
+        with pytest.raises(ValueError, match="No parameter prefix"):
+            create_prefix_removal_action(raw_input)
+
+    def test_comma_separated_prefixes_match_any(self) -> None:
+        """Each comma-separated prefix is matched on its own."""
+        action = create_prefix_removal_action("internal_, private_,secret_")
+
+        assert isinstance(action.matcher, MultiPrefixMatcher)
+        assert action.check("internal_id")
+        assert action.check("Private_note")
+        assert action.check("secret_key")
+        assert not action.check("public_name")
+        assert not action.check("x_internal_id")
+
+    def test_strict_mode_respects_case(self) -> None:
+        """Strict mode applies to every prefix in the list."""
+        single = create_prefix_removal_action("secret_", strict_mode=True)
+        several = create_prefix_removal_action("secret_, internal_", strict_mode=True)
+
+        assert single.check("secret_x")
+        assert not single.check("Secret_x")
+        assert several.check("internal_x")
+        assert not several.check("INTERNAL_x")
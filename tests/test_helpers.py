@@ -0,0 +1,209 @@
+"""Unit tests for the parameter processor."""
+
+import pytest
+from specklepy.objects import Base
+from specklepy.objects.graph_traversal.traversal import TraversalContext
+
+from data_shield.actions import RemovalAction, create_anonymization_action, create_prefix_removal_action
+from data_shield.helpers import ParameterProcessor
+from data_shield.matchers import MultiPrefixMatcher, ParameterMatcher, PrefixMatcher
+
+
+def _object_with_property(value: str) -> Base:
+    """Build an object carrying a single v3-style property with the given value."""
+    speckle_object = Base()
+    speckle_object.id = "object-id"
+    speckle_object.properties = {"Identity": {"Contact": {"name": "Contact", "value": value}}}
+    return speckle_object
+
+
+def _revit_parameter(name: str, value: object) -> Base:
+    """Build a v2 Revit parameter object."""
+    parameter = Base(speckle_type="Objects.BuiltElements.Revit.Parameter")
+    parameter.name = name
+    parameter.value = value
+    return parameter
+
+
+def _object_with_revit_parameters() -> Base:
+    """Build an object carrying a v2 ``parameters`` Base with a mix of members."""
+    parameters = Base()
+    parameters["SECRET_CODE"] = _revit_parameter("Secret_Code", "abc")
+    # The parameter object's own name wins over the member key
+    parameters["secret_alias"] = _revit_parameter("Alias", "value")
+    parameters["Comments"] = _revit_parameter("Comments", "ask jo.doe@ex.com")
+    parameters["Mark"] = _revit_parameter("Mark", "A1")
+    parameters["Height"] = _revit_parameter("Height", 3.2)
+    # Dict members are named by their key
+    parameters["secret_raw"] = {"name": "ignored", "value": "x@y.org"}
+    # Members that are not parameters are never touched
+    parameters["secret_scalar"] = "plain"
+    parameters["secret_without_value"] = Base()
+
+    speckle_object = Base()
+    speckle_object.id = "wall-1"
+    speckle_object.parameters = parameters
+    return speckle_object
+
+
+class TestRevitParameters:
+    """Test v2 Revit ``parameters`` handling through ParameterProcessor."""
+
+    def test_prefix_removal_removes_matching_members(self) -> None:
+        """Members whose parameter name matches the prefix are removed from the parameters Base."""
+        speckle_object = _object_with_revit_parameters()
+        action = create_prefix_removal_action("secret")
+        processor = ParameterProcessor(action)
+
+        processor.process_context(TraversalContext(speckle_object))
+
+        assert sorted(speckle_object.parameters.get_dynamic_member_names()) == [
+            "Comments",
+            "Height",
+            "Mark",
+            "secret_alias",
+            "secret_scalar",
+            "secret_without_value",
+        ]
+        assert action.affected_names == {"Secret_Code", "secret_raw"}
+        assert processor.processed_objects == {"wall-1"}
+
+    def test_prefix_removal_without_matches_leaves_parameters(self) -> None:
+        """Nothing is removed or reported when no parameter name matches."""
+        speckle_object = _object_with_revit_parameters()
+        before = sorted(speckle_object.parameters.get_dynamic_member_names())
+        action = create_prefix_removal_action("internal_")
+        processor = ParameterProcessor(action)
+
+        processor.process_context(TraversalContext(speckle_object))
+
+        assert sorted(speckle_object.parameters.get_dynamic_member_names()) == before
+        assert not action.affected_names
+        assert not processor.processed_objects
+
+    def test_anonymization_reports_parameters_with_emails(self) -> None:
+        """Parameters whose values hold an email are reported and no member is removed."""
+        speckle_object = _object_with_revit_parameters()
+        before = sorted(speckle_object.parameters.get_dynamic_member_names())
+        action = create_anonymization_action()
+        processor = ParameterProcessor(action, check_values=True)
+
+        processor.process_context(TraversalContext(speckle_object))
+
+        assert sorted(speckle_object.parameters.get_dynamic_member_names()) == before
+        assert action.affected_names == {"Comments", "secret_raw"}
+        assert processor.processed_objects == {"wall-1"}
+
+
+class TestAnonymization:
+    """Test email anonymization through ParameterProcessor."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("john@example.com", "j**n@example.com"),
+            ("名前john@example.com", "名前j**n@example.com"),
+            ("userémail@ex.com", "userém**l@ex.com"),
+            ("mail a@b.io, bob.smith@corp.org", "mail *@b.io, b*******h@corp.org"),
+            # The next address can start right where the previous one ends
+            ("john@site.com+jane@site.org", "j**n@site.com+***e@site.org"),
+            ("a@b.com_x@y.org", "*@b.com_*@y.org"),
+            ("jo@x.com%ann@y.org", "j*@x.com%**n@y.org"),
+            ("a@b.co+c@d.co+e@f.co", "*@b.co+*@d.co+*@f.co"),
+            # A '.' joins the domain, so "bob" becomes part of the first address
+            ("mary@a.io.bob@b.io", "m**y@a.io.bob@b.io"),
+        ],
+    )
+    def test_masks_emails_in_property_values(self, value: str, expected: str) -> None:
+        """Addresses are masked wherever they start, including right after non-ASCII letters."""
+        speckle_object = _object_with_property(value)
+        processor = ParameterProcessor(create_anonymization_action(), check_values=True)
+
+        processor.process_context(TraversalContext(speckle_object))
+
+        assert speckle_object.properties["Identity"]["Contact"]["value"] == expected
+        assert processor.processed_objects == {"object-id"}
+
+    def test_leaves_values_without_emails_untouched(self) -> None:
+        """Values with an '@' but no address are not changed or reported."""
+        speckle_object = _object_with_property("meet @ noon")
+        processor = ParameterProcessor(create_anonymization_action(), check_values=True)
+
+        processor.process_context(TraversalContext(speckle_object))
+
+        assert speckle_object.properties["Identity"]["Contact"]["value"] == "meet @ noon"
+        assert not processor.processed_objects
+
+
+# Names with mixed case, non-ASCII leads and an empty name
+_REJECT_NAMES = [
+    "secret",
+    "Secret",
+    "SECRET",
+    "sEcret",
+    "internal",
+    "Internal",
+    "ßecret",
+    "İD",
+    "id",
+    "Id",
+    "é",
+    "",
+    "x",
+]
+
+
+def _named_properties(names: list[str]) -> dict:
+    """Build a flat v3 properties dict with one parameter per name."""
+    return {f"key{index}": {"name": name, "value": index} for index, name in enumerate(names)}
+
+
+class TestFirstCharacterReject:
+    """Test that the name walk's first-character reject never skips a name the action accepts."""
+
+    @pytest.mark.parametrize(
+        "matcher",
+        [
+            PrefixMatcher("secret"),
+            PrefixMatcher("secret", True),
+            PrefixMatcher("SECRET", True),
+            PrefixMatcher("i"),
+            PrefixMatcher("İ"),
+            PrefixMatcher("ß"),
+            PrefixMatcher(""),
+            MultiPrefixMatcher(["secret", "Internal"]),
+            MultiPrefixMatcher(["secret", "Internal"], True),
+            MultiPrefixMatcher(["x", ""]),
+        ],
+    )
+    def test_walk_removes_exactly_what_check_accepts(self, matcher: ParameterMatcher) -> None:
+        """Properties and Revit parameters agree with calling action.check on every name."""
+        action = RemovalAction(matcher)
+        expected = {name for name in _REJECT_NAMES if action.check(name)}
+
+        properties = _named_properties(_REJECT_NAMES)
+        parameters = Base()
+        for index, name in enumerate(_REJECT_NAMES):
+            parameters[f"p{index}"] = _revit_parameter(name, index)
+        speckle_object = Base()
+        speckle_object.id = "object-id"
+        speckle_object.properties = properties
+        speckle_object.parameters = parameters
+
+        ParameterProcessor(action).process_context(TraversalContext(speckle_object))
+
+        assert action.affected_names == expected
+        assert {parameter["name"] for parameter in properties.values()} == set(_REJECT_NAMES) - expected
+        remaining = {getattr(parameters, key).name for key in parameters.get_dynamic_member_names()}
+        assert remaining == set(_REJECT_NAMES) - expected
+
+    def test_empty_prefix_disables_the_reject(self) -> None:
+        """An empty prefix matches every name, including the empty one."""
+        assert PrefixMatcher("").first_chars is None
+        assert MultiPrefixMatcher(["x", ""]).first_chars is None
+
+    def test_non_strict_leads_cover_both_cases(self) -> None:
+        """Case-insensitive matchers accept either case of each prefix's first character."""
+        assert PrefixMatcher("Secret").first_chars == {"s", "S"}
+        assert PrefixMatcher("Secret", True).first_chars == {"S"}
+        assert MultiPrefixMatcher(["secret", "Internal"]).first_chars == {"s", "S", "i", "I"}
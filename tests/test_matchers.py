@@ -0,0 +1,209 @@
+"""Unit tests for the parameter matchers and checkers."""
+
+import fnmatch
+import random
+import re
+
+import pytest
+
+from data_shield.matchers import (
+    _PREFIX_TUPLE_LIMIT,
+    MultiPrefixMatcher,
+    PatternChecker,
+    PrefixMatcher,
+    _GlobChecker,
+    _GlobIgnoreCaseChecker,
+    _RegexChecker,
+)
+
+# Names mixing case, separators, digits and non-ASCII letters
+NAMES = ["", "a", "ab", "abc", "abd", "ac", "b", "ABC", "Abc", "xabc", "ab_c", "a.b", "abcx", "Höhe", "café", "éab"]
+
+
+def _reference_check(pattern: str, strict: bool, name: str) -> bool:
+    """Match a name the way PatternChecker did before compiling and specializing patterns."""
+    if pattern.startswith("/") and pattern.rstrip("i").endswith("/"):
+        if pattern.endswith("/i"):
+            return re.search(pattern[1:-2], name, re.IGNORECASE) is not None
+        return re.search(pattern[1:-1], name, 0 if strict else re.IGNORECASE) is not None
+    if strict:
+        return fnmatch.fnmatchcase(name, pattern)
+    return fnmatch.fnmatch(name.lower(), pattern.lower())
+
+
+class TestPatternChecker:
+    """Test PatternChecker against the documented glob and regex semantics."""
+
+    def test_regex_word_class_matches_non_ascii_names(self) -> None:
+        """Localized parameter names keep matching Unicode-aware regex classes."""
+        checker = PatternChecker(r"/^\w+$/", True)
+
+        assert checker.check("Höhe")
+        assert checker.check("café")
+        assert not checker.check("two words")
+
+    @pytest.mark.parametrize(
+        ("pattern", "strict", "expected_type"),
+        [
+            ("/^ab/", True, _RegexChecker),
+            ("/^ab/", False, _RegexChecker),
+            ("/ab/i", True, _RegexChecker),
+            ("ab*", True, _GlobChecker),
+            ("ab*", False, _GlobIgnoreCaseChecker),
+            ("/not regex", True, _GlobChecker),
+        ],
+    )
+    def test_dispatches_to_specialized_checker(self, pattern: str, strict: bool, expected_type: type) -> None:
+        """The constructor returns the checker specialized for the pattern kind and case mode."""
+        checker = PatternChecker(pattern, strict)
+
+        assert type(checker) is expected_type
+        assert isinstance(checker, PatternChecker)
+        assert [checker.check(name) for name in NAMES] == [_reference_check(pattern, strict, name) for name in NAMES]
+
+
+def _any_prefix(name: str, prefixes: list[str], strict_mode: bool) -> bool:
+    """Reference prefix check: test every prefix on its own."""
+    if strict_mode:
+        return any(name.startswith(prefix) for prefix in prefixes)
+    return any(name.lower().startswith(prefix.lower()) for prefix in prefixes)
+
+
+class TestPrefixMatcher:
+    """Test PrefixMatcher against lowercasing the whole name."""
+
+    @pytest.mark.parametrize(
+        ("prefix", "name", "expected"),
+        [
+            ("i", "İD", True),
+            ("i̇", "İD", True),
+            ("ασ", "ΑΣΑ", True),
+            ("ας", "ΑΣΑ", False),
+            ("ας", "ΑΣ", True),
+            ("secret", "SECRET_x", True),
+            ("secret", "SECRE", False),
+        ],
+    )
+    def test_case_insensitive_prefix_handles_non_ascii_case_mapping(
+        self, prefix: str, name: str, expected: bool
+    ) -> None:
+        """Characters that lengthen or change form when lowercased match as on the whole name."""
+        assert PrefixMatcher(prefix).matches(name) is expected
+        assert name.lower().startswith(prefix.lower()) is expected
+
+    def test_matches_like_lowercasing_the_whole_name(self) -> None:
+        """Random prefixes and names over tricky case mappings agree with the reference check."""
+        rng = random.Random(0)
+        alphabet = "aAiIİıΣσςΑ'x_"
+        for _ in range(2000):
+            prefix = "".join(rng.choices(alphabet, k=rng.randint(0, 3)))
+            name = "".join(rng.choices(alphabet, k=rng.randint(0, 5)))
+            assert PrefixMatcher(prefix).matches(name) == _any_prefix(name, [prefix], False), (prefix, name)
+
+
+class TestMultiPrefixMatcher:
+    """Test MultiPrefixMatcher's tuple and trie paths against a per-prefix check."""
+
+    @pytest.mark.parametrize("count", [2, _PREFIX_TUPLE_LIMIT, _PREFIX_TUPLE_LIMIT + 1, 200])
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    def test_matches_like_checking_each_prefix(self, count: int, strict_mode: bool) -> None:
+        """Both storage strategies agree with testing the prefixes one by one."""
+        rng = random.Random(count)
+        alphabet = "abAB_1éİΣσς"
+        prefixes = ["".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(count)]
+        names = ["".join(rng.choices(alphabet, k=rng.randint(0, 6))) for _ in range(500)]
+        matcher = MultiPrefixMatcher(prefixes, strict_mode)
+
+        for name in names:
+            assert matcher.matches(name) == _any_prefix(name, prefixes, strict_mode), name
+
+    @pytest.mark.parametrize("count", [2, _PREFIX_TUPLE_LIMIT + 1])
+    @pytest.mark.parametrize(("prefix", "name"), [("i", "İD"), ("ασ", "ΑΣΑ"), ("ας", "ΑΣΑ"), ("ας", "ΑΣ")])
+    def test_agrees_with_single_prefix_on_non_ascii_case_mapping(self, count: int, prefix: str, name: str) -> None:
+        """One prefix and several prefixes give the same verdict when lowercasing is context dependent."""
+        prefixes = [prefix] + [f"z{i}" for i in range(count - 1)]
+
+        assert MultiPrefixMatcher(prefixes).matches(name) == PrefixMatcher(prefix).matches(name)
+
+    def test_uses_tuple_up_to_limit_then_trie(self) -> None:
+        """Small prefix sets use str.startswith; larger ones build a trie."""
+        small = MultiPrefixMatcher(["a", "b"])
+        large = MultiPrefixMatcher([f"p{i}" for i in range(_PREFIX_TUPLE_LIMIT + 1)])
+
+        assert small._prefix_tuple is not None
+        assert large._prefix_tuple is None
+        assert large.matches("P12_name")
+        assert not large.matches("q1")
+
+    def test_nested_prefixes_in_trie(self) -> None:
+        """A short prefix that is also the start of a longer one still matches on its own."""
+        prefixes = ["ab", "abcd"] + [f"z{i}" for i in range(_PREFIX_TUPLE_LIMIT)]
+        matcher = MultiPrefixMatcher(prefixes, True)
+
+        assert matcher.matches("abx")
+        assert matcher.matches("abcdx")
+        assert not matcher.matches("a")
+
+
+# Short random names over the characters the prefix patterns below care about
+_RANDOM = random.Random(0)
+PREFIX_NAMES = NAMES + ["".join(_RANDOM.choices("abcdxAB_", k=_RANDOM.randint(0, 5))) for _ in range(300)]
+
+
+class TestLiteralPrefix:
+    """Test that the literal-prefix shortcut never rejects a name the full pattern accepts."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "/^abc/",
+            "/^ab?c/",
+            "/^ab*c/",
+            "/^ab+c/",
+            "/^ab{0,2}c/",
+            "/^a{0}b/",
+            "/^abc|x/",
+            "/x|^ab/",
+            "/^ab\\b/",
+            "/^(ab)c/",
+            "/^ab[cd]/",
+            "/^ab.c/",
+            "/^abc/i",
+            "/^ABC/i",
+            "/^/",
+            "/ab/",
+        ],
+    )
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_regex_matches_like_re_search(self, pattern: str, strict: bool) -> None:
+        """Anchored, quantified, alternated and ignore-case regexes keep re.search semantics."""
+        checker = PatternChecker(pattern, strict)
+
+        for name in PREFIX_NAMES:
+            assert checker.check(name) == _reference_check(pattern, strict, name), name
+
+    @pytest.mark.parametrize("pattern", ["ab*", "ab?", "a[bc]*", "[ab]c", "ab[!c]*", "a*c", "abc", "AB*", "*", ""])
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_glob_matches_like_fnmatch(self, pattern: str, strict: bool) -> None:
+        """Globs with wildcards or character classes keep fnmatch semantics."""
+        checker = PatternChecker(pattern, strict)
+
+        for name in PREFIX_NAMES:
+            assert checker.check(name) == _reference_check(pattern, strict, name), name
+
+    @pytest.mark.parametrize(
+        ("pattern", "strict", "prefix"),
+        [
+            ("/^abc/", True, "abc"),
+            ("/^ab?c/", True, "a"),
+            ("/^a{0}b/", True, ""),
+            ("/^abc|x/", True, ""),
+            ("/^abc/i", True, ""),
+            ("/^abc/", False, ""),
+            ("ab[cd]*", True, "ab"),
+            ("AB*", False, "ab"),
+        ],
+    )
+    def test_prefix_is_conservative(self, pattern: str, strict: bool, prefix: str) -> None:
+        """Only text every match must start with is used as the prefix."""
+        assert PatternChecker(pattern, strict)._literal_prefix == prefix